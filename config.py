@@ -4,16 +4,46 @@
 """
 
 import os
+from dataclasses import dataclass
+
+# JSON读写：优先使用orjson（可选依赖），未安装时回退到标准库json
+try:
+    import orjson
+    
+    def json_loads(data):
+        """解析JSON（bytes或str）"""
+        return orjson.loads(data)
+    
+    def json_dumps(obj):
+        """序列化为缩进2格的UTF-8 JSON（bytes）"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    
+    def json_loads(data):
+        """解析JSON（bytes或str）"""
+        return json.loads(data)
+    
+    def json_dumps(obj):
+        """序列化为缩进2格的UTF-8 JSON（bytes）"""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
 
 # 摄像头配置
 CAMERA_INDEX = 0  # 默认摄像头索引
 CAMERA_WIDTH = 640
 CAMERA_HEIGHT = 480
+CAMERA_FOURCC = "MJPG"  # 摄像头像素格式（MJPEG由摄像头压缩，降低USB带宽）
+DISPLAY_FPS = 15  # 预览窗口刷新率上限（画面显示不需要跟推理同频）
 
 # MediaPipe 配置
 MIN_DETECTION_CONFIDENCE = 0.7
-MIN_TRACKING_CONFIDENCE = 0.5
+MIN_TRACKING_CONFIDENCE = 0.4  # 跟踪置信度稍低，减少重新运行手掌检测的次数
 MAX_NUM_HANDS = 1  # 只检测一只手
+USE_GPU_DELEGATE = True  # 尝试使用GPU推理（仅Linux/macOS支持，失败时自动回退到CPU）
+INFERENCE_INTERVAL = 2  # 每隔几帧运行一次手部推理，中间帧复用上一次的关键点（1=每帧推理）
+INFERENCE_WIDTH = 320  # 手部推理输入最大宽度（保持宽高比缩小后推理，关键点按原始分辨率换算）
+INFERENCE_HEIGHT = 240  # 手部推理输入最大高度
+PIN_CPU_COUNT = 4  # --pin-cores 时绑定的逻辑CPU数量（混合架构下前几个通常是性能核）
 
 # 手势识别配置
 FINGER_STATE_THRESHOLD = 0.015  # 手指状态判断阈值（降低提高准确度）
@@ -99,3 +129,23 @@ MUSIC_GESTURE_ACTIONS = {
 
 # 调试模式
 DEBUG_MODE = True
+
+
+# 用户设置默认值（user_settings.json 中缺失的项使用这里的值，主程序和设置界面共用）
+@dataclass(frozen=True)
+class UserSettings:
+    """用户设置"""
+    camera_index: int = 0
+    camera_width: int = 1024
+    camera_height: int = 768
+    mouse_sensitivity: float = 8.0
+    volume_step: float = 0.05
+    brightness_step: int = 10
+    gesture_cooldown: float = 0.5
+    scroll_speed: int = 5
+    auto_mode_switch: bool = True
+    ui_primary_color: tuple = (0, 150, 255)
+    ui_background_color: tuple = (30, 30, 40)
+
+
+DEFAULT_USER_SETTINGS = UserSettings()
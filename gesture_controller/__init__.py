@@ -7,5 +7,9 @@ from .hand_tracker import HandTracker
 from .gesture_recognizer import GestureRecognizer
 from .action_executor import ActionExecutor
 from .utils import FPSCounter
+from .frame_grabber import FrameGrabber
+from .env_watcher import EnvironmentWatcher
+from .display_thread import DisplayThread
+from .auto_mode import AutoModeSwitcher
 
-__all__ = ['HandTracker', 'GestureRecognizer', 'ActionExecutor', 'FPSCounter']
+__all__ = ['HandTracker', 'GestureRecognizer', 'ActionExecutor', 'FPSCounter', 'FrameGrabber', 'EnvironmentWatcher', 'DisplayThread', 'AutoModeSwitcher']
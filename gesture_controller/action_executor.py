@@ -14,8 +14,10 @@ import time
 import threading
 import sys
 
-# 添加项目根目录到路径
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# 添加项目根目录到路径（已存在时不重复添加）
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 from config import BRIGHTNESS_STEP, VOLUME_STEP, SCREENSHOT_DIR, SCREENSHOT_PREFIX, CAMERA_WIDTH, CAMERA_HEIGHT, MOUSE_SENSITIVITY, MOUSE_SMOOTHING, MOUSE_DEAD_ZONE
 
 
@@ -53,6 +55,11 @@ class ActionExecutor:
         self.last_music_action_time = 0  # 上次音乐动作时间
         self.music_action_cooldown = 0.3  # 音乐动作冷却时间
         
+        # 亮度读取较慢（Windows下走WMI），状态查询时缓存结果
+        self.brightness_refresh_interval = 5.0  # 缓存有效期（秒），用于发现外部修改
+        self._brightness_value = None
+        self._brightness_time = 0
+        
     def _init_volume_control(self):
         """
         初始化音量控制接口（使用pycaw官方方法）
@@ -197,6 +204,7 @@ class ActionExecutor:
             current_brightness = sbc.get_brightness()[0]
             new_brightness = min(100, current_brightness + BRIGHTNESS_STEP)
             sbc.set_brightness(new_brightness)
+            self._cache_brightness(new_brightness)
             print(f"亮度+: {new_brightness}%")
         except Exception as e:
             print(f"亮度调节失败: {e}")
@@ -207,6 +215,7 @@ class ActionExecutor:
             current_brightness = sbc.get_brightness()[0]
             new_brightness = max(0, current_brightness - BRIGHTNESS_STEP)
             sbc.set_brightness(new_brightness)
+            self._cache_brightness(new_brightness)
             print(f"亮度-: {new_brightness}%")
         except Exception as e:
             print(f"亮度调节失败: {e}")
@@ -537,11 +546,15 @@ class ActionExecutor:
             except:
                 status["current_volume"] = "Unknown"
         
-        # 获取当前亮度
-        try:
-            current_brightness = sbc.get_brightness()[0]
-            status["current_brightness"] = f"{current_brightness}%"
-        except:
+        # 获取当前亮度（缓存过期时才重新读取）
+        if time.monotonic() - self._brightness_time >= self.brightness_refresh_interval:
+            try:
+                self._cache_brightness(sbc.get_brightness()[0])
+            except:
+                self._cache_brightness(None)
+        if self._brightness_value is not None:
+            status["current_brightness"] = f"{self._brightness_value}%"
+        else:
             status["current_brightness"] = "Unknown"
         
         # 鼠标冻结状态
@@ -553,6 +566,16 @@ class ActionExecutor:
         
         return status
     
+    def _cache_brightness(self, brightness):
+        """
+        记录最新的亮度值
+        
+        Args:
+            brightness: 亮度百分比，读取失败时为None
+        """
+        self._brightness_value = brightness
+        self._brightness_time = time.monotonic()
+    
     def set_mouse_sensitivity(self, sensitivity: float):
         """设置鼠标灵敏度"""
         self.mouse_sensitivity = max(1.0, min(20.0, sensitivity))
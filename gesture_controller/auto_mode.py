@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+自动模式切换模块（根据音乐播放和浏览器状态切换手势模式）
+"""
+
+import logging
+
+log = logging.getLogger("gesture_control")
+
+
+class AutoModeSwitcher:
+    """自动模式切换（音乐模式优先级最高，其次是浏览器模式）"""
+    
+    def __init__(self, gesture_recognizer, action_executor, auto_browser=True):
+        """
+        初始化自动模式切换
+        
+        Args:
+            gesture_recognizer: 手势识别器（持有当前模式）
+            action_executor: 动作执行器（离开浏览器模式时停止滚动）
+            auto_browser: 是否根据浏览器状态自动切换
+        """
+        self.gesture_recognizer = gesture_recognizer
+        self.action_executor = action_executor
+        self.auto_browser = auto_browser
+        self.last_known_mode = "MAIN"  # 记录上一次的非自动切换的模式
+        
+        # 最近一次检测到的环境状态（由事件更新，任何时候读取都有效）
+        self.music_playing = False
+        self.music_app_name = None
+        self.music_mode_override = False  # 音乐模式是否覆盖其他模式
+        self.browser_active = False
+        self.browser_name = None
+        
+        # (事件类型, 是否活动) -> 处理函数
+        self._rules = {
+            ('music', True): self._on_music_start,
+            ('music', False): self._on_music_stop,
+            ('browser', True): self._on_browser_focus,
+            ('browser', False): self._on_browser_blur,
+        }
+    
+    def handle_event(self, kind, active, app_name):
+        """
+        处理一条环境变化事件
+        
+        Args:
+            kind: 事件类型（'music' 或 'browser'）
+            active: 是否活动
+            app_name: 应用名称
+        """
+        self._rules[(kind, bool(active))](app_name)
+    
+    def _on_music_start(self, app_name):
+        """检测到音乐播放：切换到音乐模式（覆盖其他模式）"""
+        self.music_playing, self.music_app_name = True, app_name
+        current_mode = self.gesture_recognizer.mode
+        if current_mode == "MUSIC":
+            return
+        
+        if not self.music_mode_override:  # 如果当前不是被音乐模式覆盖的状态
+            self.last_known_mode = current_mode  # 保存当前模式
+            self.music_mode_override = True
+        log.info("\n[自动] 检测到音乐: %s\n[自动] 切换到 音乐模式 (覆盖)", app_name)
+        self.gesture_recognizer.toggle_mode(target_mode="MUSIC")
+    
+    def _on_music_stop(self, app_name):
+        """音乐停止：恢复之前的模式，然后按当前浏览器状态重新判断"""
+        self.music_playing, self.music_app_name = False, None
+        self.music_mode_override = False
+        if self.gesture_recognizer.mode == "MUSIC":
+            log.info("\n[自动] 音乐已停止\n[自动] 恢复到 %s 模式", self.last_known_mode)
+            self._restore_mode()
+        
+        self._apply_browser_state()
+    
+    def _on_browser_focus(self, app_name):
+        """浏览器成为活动窗口"""
+        self.browser_active, self.browser_name = True, app_name
+        self._apply_browser_state()
+    
+    def _on_browser_blur(self, app_name):
+        """浏览器失去焦点"""
+        self.browser_active, self.browser_name = False, None
+        self._apply_browser_state()
+    
+    def _apply_browser_state(self):
+        """按最近的浏览器状态切换模式（音乐模式优先级最高，覆盖期间不处理）"""
+        if not self.auto_browser or self.music_mode_override:
+            return
+        
+        current_mode = self.gesture_recognizer.mode
+        if self.browser_active and current_mode != "BROWSER":
+            # 检测到浏览器且当前不在浏览器模式，自动切换
+            self.last_known_mode = current_mode  # 保存当前模式
+            log.info("\n[自动] 检测到浏览器: %s\n[自动] 切换到 浏览器模式", self.browser_name)
+            self.gesture_recognizer.toggle_mode(target_mode="BROWSER")
+        
+        elif not self.browser_active and current_mode == "BROWSER":
+            # 浏览器失去焦点且当前在浏览器模式，停止滚动并恢复之前模式
+            self.action_executor._stop_browser_scroll()
+            log.info("\n[自动] 浏览器失去焦点\n[自动] 恢复到 %s 模式", self.last_known_mode)
+            self._restore_mode()
+    
+    def _restore_mode(self):
+        """恢复到自动切换之前的模式"""
+        self.gesture_recognizer.toggle_mode(target_mode=self.last_known_mode)
+        self.last_known_mode = "MAIN"  # 重置
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+预览窗口线程模块
+"""
+
+import queue
+import threading
+
+import cv2
+import numpy as np
+
+
+class DisplayThread(threading.Thread):
+    """预览窗口线程（三缓冲，独占OpenCV窗口）"""
+    
+    def __init__(self, window_name, fps=15):
+        """
+        初始化预览窗口线程
+        
+        Args:
+            window_name: 窗口标题
+            fps: 窗口刷新率上限
+        """
+        super().__init__(daemon=True)
+        self.window_name = window_name
+        self.interval_ms = max(1, int(1000 / fps))
+        self.lock = threading.Lock()
+        self.keys = queue.Queue()  # 窗口中的按键，由主循环取出
+        # 三个缓冲区分别由主循环写入、等待显示、显示线程读取，任何时刻互不重叠
+        self._buffers = [None, None, None]
+        self._back = 0  # 主循环写入的缓冲区（只有主循环访问）
+        self._pending = 1  # 最新提交、等待显示的缓冲区（持锁访问）
+        self._front = 2  # 显示线程正在读取的缓冲区（只有显示线程访问）
+        self._new = False  # 等待显示的缓冲区是否有未显示的新画面
+        self._window_created = False
+        self._stop_event = threading.Event()
+    
+    def show(self, frame):
+        """
+        提交一帧画面（只在主循环中调用）
+        
+        画面复制到写入缓冲区，然后在锁内与等待显示的缓冲区交换下标
+        
+        Args:
+            frame: 要显示的BGR图像
+        """
+        # 写入缓冲区不会被显示线程读取，复制无需加锁
+        buffer = self._buffers[self._back]
+        if buffer is None or buffer.shape != frame.shape:
+            buffer = self._buffers[self._back] = np.empty(frame.shape, dtype=frame.dtype)
+        np.copyto(buffer, frame)
+        
+        # 锁内只交换下标，不会被显示线程的imshow阻塞
+        with self.lock:
+            self._back, self._pending = self._pending, self._back
+            self._new = True
+    
+    def run(self):
+        """刷新窗口并收集按键（窗口的创建、刷新和销毁都在本线程中完成）"""
+        while not self._stop_event.is_set():
+            with self.lock:
+                new = self._new
+                if new:
+                    self._front, self._pending = self._pending, self._front
+                    self._new = False
+            
+            # imshow在锁外执行，主循环此时只会写入另外两个缓冲区
+            if new:
+                cv2.imshow(self.window_name, self._buffers[self._front])
+                self._window_created = True
+            
+            if not self._window_created:
+                # 窗口还没创建时waitKey不会等待，改为等待停止事件
+                self._stop_event.wait(self.interval_ms / 1000)
+                continue
+            
+            key = cv2.waitKey(self.interval_ms) & 0xFF
+            if key != 255:
+                self.keys.put(key)
+        
+        if self._window_created:
+            cv2.destroyWindow(self.window_name)
+    
+    def get_key(self):
+        """
+        取出一个按键（非阻塞）
+        
+        Returns:
+            int: 按键码（低8位），无按键时为255
+        """
+        try:
+            return self.keys.get_nowait()
+        except queue.Empty:
+            return 255
+    
+    def stop(self):
+        """停止显示线程并关闭窗口"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout=1.0)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+前台环境检测线程模块
+"""
+
+import queue
+import threading
+import time
+
+from .utils import is_browser_active, get_browser_name, is_music_playing
+
+
+class EnvironmentWatcher(threading.Thread):
+    """前台环境检测线程（定期检测音乐播放和浏览器，状态变化时推送事件）"""
+    
+    def __init__(self, music_interval=1.0, browser_interval=2.0, watch_browser=True):
+        """
+        初始化环境检测线程
+        
+        Args:
+            music_interval: 音乐播放检测间隔（秒）
+            browser_interval: 浏览器检测间隔（秒）
+            watch_browser: 是否检测浏览器
+        """
+        super().__init__(daemon=True)
+        self.music_interval = music_interval
+        self.browser_interval = browser_interval
+        self.watch_browser = watch_browser
+        # 事件: (类型'music'/'browser', 是否活动, 应用名称)，只在状态变化时推送
+        self.events = queue.Queue()
+        self._states = {'music': (False, None), 'browser': (False, None)}  # 上一次的检测结果
+        self._stop_event = threading.Event()
+    
+    def run(self):
+        """按各自的间隔执行检测（所有系统调用都在本线程中完成）"""
+        # pycaw依赖COM，每个线程都需要单独初始化
+        com_initialized = False
+        try:
+            import comtypes
+            comtypes.CoInitialize()
+            com_initialized = True
+        except Exception:
+            pass
+        
+        next_music = next_browser = time.monotonic()
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            
+            if now >= next_music:
+                next_music = now + self.music_interval
+                self._publish('music', is_music_playing())
+            
+            if self.watch_browser and now >= next_browser:
+                next_browser = now + self.browser_interval
+                browser_active = is_browser_active()
+                self._publish('browser', (browser_active, get_browser_name() if browser_active else None))
+            
+            next_check = min(next_music, next_browser) if self.watch_browser else next_music
+            self._stop_event.wait(max(0.0, next_check - time.monotonic()))
+        
+        if com_initialized:
+            comtypes.CoUninitialize()
+    
+    def _publish(self, kind, state):
+        """
+        状态变化时推送事件
+        
+        Args:
+            kind: 事件类型（'music' 或 'browser'）
+            state: (是否活动, 应用名称)
+        """
+        state = tuple(state)
+        if state != self._states[kind]:
+            self._states[kind] = state
+            self.events.put((kind,) + state)
+    
+    def get_event(self):
+        """
+        取出一个事件（非阻塞）
+        
+        Returns:
+            tuple: (类型, 是否活动, 应用名称)，没有事件时返回None
+        """
+        try:
+            return self.events.get_nowait()
+        except queue.Empty:
+            return None
+    
+    def stop(self):
+        """停止检测线程"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout=1.0)
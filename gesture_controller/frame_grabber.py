@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+摄像头采集线程模块
+"""
+
+import threading
+
+
+class FrameGrabber(threading.Thread):
+    """摄像头采集线程（只保留最新一帧）"""
+    
+    def __init__(self, cap):
+        """
+        初始化采集线程
+        
+        Args:
+            cap: 已打开的cv2.VideoCapture对象
+        """
+        super().__init__(daemon=True)
+        self.cap = cap
+        self.frame = None
+        self.failed = False  # 摄像头读取失败时置为True
+        self.lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._new = threading.Event()  # 有新帧可取（或摄像头已失败）
+    
+    def run(self):
+        """
+        持续读取摄像头，避免驱动缓冲区积压过期画面
+        
+        每帧都grab()取走驱动缓冲并retrieve()解码，新帧直接替换还没被取走的旧帧，
+        主循环每次取到的都是最新的一帧
+        """
+        while not self._stop_event.is_set():
+            if not self.cap.grab():
+                self.failed = True
+                self._new.set()  # 唤醒正在等待的主循环
+                break
+            
+            success, frame = self.cap.retrieve()
+            if not success:
+                continue
+            
+            with self.lock:
+                self.frame = frame
+            self._new.set()
+    
+    def read(self, timeout=None):
+        """
+        取出最新的一帧
+        
+        Args:
+            timeout: 没有新帧时最多等待的秒数，None表示不等待
+            
+        Returns:
+            numpy.ndarray: 最新帧；超时仍没有新帧时返回None
+        """
+        frame = self._pop()
+        if frame is None and timeout and self._new.wait(timeout):
+            frame = self._pop()
+        return frame
+    
+    def _pop(self):
+        """取走缓存的帧（先清除事件再取，之后到达的帧会重新置位事件）"""
+        self._new.clear()
+        with self.lock:
+            frame, self.frame = self.frame, None
+        return frame
+    
+    def stop(self):
+        """停止采集线程（需在释放摄像头之前调用）"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout=1.0)
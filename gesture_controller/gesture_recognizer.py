@@ -3,14 +3,16 @@
 手势识别模块
 """
 
-import numpy as np
+import math
 import time
 import sys
 import os
 from collections import deque
 
-# 添加项目根目录到路径
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# 添加项目根目录到路径（已存在时不重复添加）
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 from config import GESTURES, GESTURE_ACTIONS, MOUSE_GESTURE_ACTIONS, BROWSER_GESTURE_ACTIONS, MUSIC_GESTURE_ACTIONS, FINGER_STATE_THRESHOLD, GESTURE_COOLDOWN, BROWSER_GESTURE_COOLDOWN, MUSIC_GESTURE_COOLDOWN
 
 
@@ -32,6 +34,10 @@ class GestureRecognizer:
         # 模式管理
         self.mode = "MAIN"  # MAIN: 主模式, MOUSE: 鼠标模式, BROWSER: 浏览器模式, MUSIC: 音乐模式
         
+        # 手势说明缓存（只在模式变化时重建）
+        self._instr_cache = None
+        self._instr_mode = None
+        
         # 用于平滑识别的队列
         self.gesture_history = deque(maxlen=5)
         self.current_gesture = None
@@ -120,7 +126,7 @@ class GestureRecognizer:
         if len(states1) != len(states2):
             return float('inf')
         
-        return np.sqrt(sum((s1 - s2)**2 for s1, s2 in zip(states1, states2)))
+        return math.sqrt(sum((s1 - s2)**2 for s1, s2 in zip(states1, states2)))
     
     def get_gesture_action(self, gesture_name):
         """
@@ -220,6 +226,9 @@ class GestureRecognizer:
         Returns:
             list: 手势说明列表
         """
+        if self._instr_cache is not None and self._instr_mode == self.mode:
+            return self._instr_cache
+        
         if self.mode == "MOUSE":
             info = [
                 "鼠标模式:",
@@ -279,6 +288,9 @@ class GestureRecognizer:
                 "按 'q' 退出",
                 "按 'r' 重置"
             ]
+        
+        self._instr_cache = info
+        self._instr_mode = self.mode
         return info
     
     def reset(self):
@@ -341,7 +353,7 @@ class GestureRecognizer:
         delta_time = end_pos['time'] - start_pos['time']
         
         # 计算距离
-        distance = np.sqrt(delta_x**2 + delta_y**2)
+        distance = math.hypot(delta_x, delta_y)
         
         # 判断方向
         direction = None
@@ -7,14 +7,28 @@ import cv2
 import numpy as np
 import urllib.request
 import os
+import sys
+import time
 from mediapipe.tasks import python
 from mediapipe.tasks.python import vision
 from mediapipe import Image as MpImage, ImageFormat
 
+# 手部骨架折线（基于MediaPipe手部连接关系，相邻关键点串成连续折线）
+HAND_CHAINS = (
+    np.array([0, 1, 2, 3, 4]),  # 拇指
+    np.array([0, 5, 6, 7, 8]),  # 食指
+    np.array([0, 9, 10, 11, 12]),  # 中指
+    np.array([0, 13, 14, 15, 16]),  # 无名指
+    np.array([0, 17, 18, 19, 20]),  # 小指
+    np.array([5, 9, 13, 17]),  # 手掌
+)
+
+
 class HandTracker:
     """MediaPipe手部追踪器（Tasks API版本）"""
     
-    def __init__(self, max_num_hands=1, min_detection_confidence=0.7, min_tracking_confidence=0.5):
+    def __init__(self, max_num_hands=1, min_detection_confidence=0.7, min_tracking_confidence=0.5, use_gpu=False,
+                 inference_interval=1, inference_size=None, mirror=False):
         """
         初始化手部追踪器
         
@@ -22,11 +36,29 @@ class HandTracker:
             max_num_hands: 最大检测手数
             min_detection_confidence: 最小检测置信度
             min_tracking_confidence: 最小跟踪置信度
+            use_gpu: 是否尝试使用GPU推理（失败时回退到CPU）
+            inference_interval: 每隔多少帧运行一次推理（1表示每帧都推理）
+            inference_size: 推理输入的最大尺寸 (宽, 高)，按原始帧宽高比缩放到该范围内，None表示使用原始帧
+            mirror: 是否水平镜像（关键点坐标和标注图像均为镜像后的画面）
         """
         self.max_num_hands = max_num_hands
         self.min_detection_confidence = min_detection_confidence
         self.min_tracking_confidence = min_tracking_confidence
+        self.use_gpu = use_gpu
         self.frame_timestamp_ms = 0
+        self.visualization_enabled = True  # 是否生成预览画面（镜像 + 标注）
+        self.draw_enabled = True  # 预览画面上是否绘制关键点
+        
+        # 跳帧推理
+        self.inference_interval = max(1, int(inference_interval))
+        self._frame_index = 0
+        self._last_result = []  # 上一次推理得到的关键点
+        self._last_points = []  # 上一次推理得到的 (21, 2) int32 像素坐标数组，用于绘制
+        self.inference_size = tuple(inference_size) if inference_size else None
+        self._annotated = None  # 复用的标注图像缓冲区
+        self._rgb = None  # 复用的RGB转换缓冲区
+        self._small = None  # 复用的缩小图像缓冲区
+        self.mirror = mirror
         
         # 下载模型文件（如果不存在）
         self.model_path = self._download_model()
@@ -61,8 +93,26 @@ class HandTracker:
         return model_path
     
     def _initialize_landmarker(self):
-        """初始化HandLandmarker"""
-        base_options = python.BaseOptions(model_asset_path=self.model_path)
+        """初始化HandLandmarker（优先GPU，不可用时回退到CPU）"""
+        # MediaPipe的Python GPU delegate目前只支持Linux和macOS
+        if self.use_gpu and not sys.platform.startswith('win'):
+            try:
+                landmarker = self._create_landmarker(python.BaseOptions.Delegate.GPU)
+                print("✓ 手部追踪使用GPU推理")
+                return landmarker
+            except Exception as e:
+                print(f"GPU推理初始化失败，回退到CPU: {e}")
+        
+        return self._create_landmarker(python.BaseOptions.Delegate.CPU)
+    
+    def _create_landmarker(self, delegate):
+        """
+        创建HandLandmarker
+        
+        Args:
+            delegate: 推理设备（BaseOptions.Delegate.CPU / GPU）
+        """
+        base_options = python.BaseOptions(model_asset_path=self.model_path, delegate=delegate)
         options = vision.HandLandmarkerOptions(
             base_options=base_options,
             min_hand_detection_confidence=self.min_detection_confidence,
@@ -76,80 +126,127 @@ class HandTracker:
         """
         处理单帧图像并检测手部
         
+        每inference_interval帧运行一次推理，其余帧复用上一次的检测结果
+        
         Args:
-            frame: BGR格式的图像帧
+            frame: BGR格式的图像帧（摄像头原始画面，镜像由mirror参数处理）
             
         Returns:
             tuple: (处理结果, 标注后的图像)
+            
+        注意: 开启可视化时返回的标注图像是复用的内部缓冲区，下一次调用会覆盖其内容；
+        关闭可视化时直接返回传入的原帧（未镜像）
+        """
+        if self._frame_index % self.inference_interval == 0:
+            self._last_result, self._last_points = self._detect(frame)
+        self._frame_index += 1
+        
+        hand_landmarks_list = self._last_result
+        
+        # 关闭可视化时直接返回原帧，不复制也不绘制
+        if not self.visualization_enabled:
+            return hand_landmarks_list, frame
+        
+        # 准备预览画面
+        if self._annotated is None or self._annotated.shape != frame.shape:
+            self._annotated = np.empty(frame.shape, dtype=frame.dtype)
+        annotated_frame = self._annotated
+        if self.mirror:
+            # 镜像与复制合并为一次遍历
+            cv2.flip(frame, 1, dst=annotated_frame)
+        else:
+            np.copyto(annotated_frame, frame)
+        
+        if not self.draw_enabled:
+            return hand_landmarks_list, annotated_frame
+        
+        # 绘制标注（跳过推理的帧也把上一次的关键点画到当前帧上）
+        for points in self._last_points:
+            # 绘制关键点和连接线
+            self._draw_landmarks(annotated_frame, points)
+        
+        return hand_landmarks_list, annotated_frame
+    
+    def _detect(self, frame):
+        """
+        运行MediaPipe推理
+        
+        Args:
+            frame: BGR格式的图像帧
+            
+        Returns:
+            tuple: (每只手的关键点像素坐标列表 [(x, y, z), ...], 每只手的 (21, 2) int32 像素坐标数组)
         """
-        # 转换为RGB
-        image_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        h, w, _ = frame.shape
+        
+        # 保持宽高比缩小后再推理，避免手部被拉伸变形
+        # （关键点是归一化坐标，按原始帧尺寸换算即可，无需额外缩放）
+        small = frame
+        if self.inference_size:
+            scale = min(self.inference_size[0] / w, self.inference_size[1] / h)
+            if scale < 1:
+                infer_w, infer_h = max(1, round(w * scale)), max(1, round(h * scale))
+                if self._small is None or self._small.shape[:2] != (infer_h, infer_w):
+                    self._small = np.empty((infer_h, infer_w, 3), dtype=np.uint8)
+                small = cv2.resize(frame, (infer_w, infer_h), dst=self._small, interpolation=cv2.INTER_AREA)
+        
+        # 转换为RGB（写入复用的缓冲区，MpImage会复制数据，不会持有该缓冲区）
+        if self._rgb is None or self._rgb.shape != small.shape:
+            self._rgb = np.empty(small.shape, dtype=np.uint8)
+        image_rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb)
         
         # 创建MediaPipe Image对象
         mp_image = MpImage(image_format=ImageFormat.SRGB, data=image_rgb)
         
-        # 增加时间戳
-        self.frame_timestamp_ms += 33  # 假设30fps，每帧约33ms
+        # 使用真实时间戳（采集线程会丢帧，推理帧间隔并不固定），并保证严格递增
+        timestamp_ms = int(time.monotonic() * 1000)
+        self.frame_timestamp_ms = max(timestamp_ms, self.frame_timestamp_ms + 1)
         
-        # 检测手部
+        # 检测手部（推理用未镜像的画面，镜像在坐标换算时完成，不需要单独翻转图像）
         detection_result = self.landmarker.detect_for_video(mp_image, self.frame_timestamp_ms)
         
-        # 绘制标注
-        annotated_frame = frame.copy()
         hand_landmarks_list = []
-        
+        hand_points = []
         if detection_result.hand_landmarks:
             for hand_landmarks in detection_result.hand_landmarks:
-                # 提取关键点坐标
-                landmarks = []
-                for landmark in hand_landmarks:
-                    h, w, _ = frame.shape
-                    x = int(landmark.x * w)
-                    y = int(landmark.y * h)
-                    z = landmark.z
-                    landmarks.append((x, y, z))
+                # 一次读出全部关键点，镜像和像素换算在 (21, 3) 数组上整体完成
+                coords = np.array([(landmark.x, landmark.y, landmark.z) for landmark in hand_landmarks])
+                if self.mirror:
+                    coords[:, 0] = 1.0 - coords[:, 0]
+                coords[:, 0] *= w
+                coords[:, 1] *= h
+                points = coords[:, :2].astype(np.int32)
+                hand_points.append(points)
                 
+                # 下游逐个下标读取坐标，Python元组比NumPy标量索引更快，所以仍提供元组列表
+                landmarks = [(x, y, z) for (x, y), z in zip(points.tolist(), coords[:, 2].tolist())]
                 hand_landmarks_list.append(landmarks)
-                
-                # 绘制关键点和连接线
-                self._draw_landmarks(annotated_frame, hand_landmarks)
         
-        return hand_landmarks_list, annotated_frame
+        return hand_landmarks_list, hand_points
     
-    def _draw_landmarks(self, frame, hand_landmarks):
+    def _draw_landmarks(self, frame, points):
         """
         在图像上绘制手部关键点（手动实现）
         
         Args:
             frame: 图像帧
-            hand_landmarks: MediaPipe手部关键点列表
+            points: (N, 2) int32 像素坐标数组
         """
-        h, w, _ = frame.shape
+        # 绘制连接线：6条连续折线一次polylines调用完成，关节处连接更平滑
+        chains = [points[chain] for chain in HAND_CHAINS]
+        cv2.polylines(frame, chains, False, (255, 0, 0), 2, cv2.LINE_AA)
         
         # 绘制关键点
-        for landmark in hand_landmarks:
-            x = int(landmark.x * w)
-            y = int(landmark.y * h)
+        for x, y in points.tolist():
             cv2.circle(frame, (x, y), 5, (0, 255, 0), -1)
-        
-        # 绘制连接线（基于MediaPipe手部连接关系）
-        connections = [
-            (0, 1), (1, 2), (2, 3), (3, 4),  # 拇指
-            (0, 5), (5, 6), (6, 7), (7, 8),  # 食指
-            (0, 9), (9, 10), (10, 11), (11, 12),  # 中指
-            (0, 13), (13, 14), (14, 15), (15, 16),  # 无名指
-            (0, 17), (17, 18), (18, 19), (19, 20),  # 小指
-            (5, 9), (9, 13), (13, 17)  # 手掌
-        ]
-        
-        for connection in connections:
-            idx1, idx2 = connection
-            if idx1 < len(hand_landmarks) and idx2 < len(hand_landmarks):
-                x1 = int(hand_landmarks[idx1].x * w)
-                y1 = int(hand_landmarks[idx1].y * h)
-                x2 = int(hand_landmarks[idx2].x * w)
-                y2 = int(hand_landmarks[idx2].y * h)
-                cv2.line(frame, (x1, y1), (x2, y2), (255, 0, 0), 2)
+    
+    def set_visualization(self, enabled: bool):
+        """设置是否绘制手部关键点（无预览窗口时关闭以节省开销）"""
+        self.visualization_enabled = enabled
+    
+    def set_draw_landmarks(self, enabled: bool):
+        """设置预览画面上是否绘制关键点（只需要控制功能时可关闭）"""
+        self.draw_enabled = enabled
     
     def get_finger_states(self, landmarks):
         """
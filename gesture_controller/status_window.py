@@ -5,29 +5,90 @@
 
 import tkinter as tk
 from tkinter import ttk
-import queue
+import re
 import threading
 import time
 
+# 模式 -> (显示文本, 颜色)
+_MODE_STYLES = {
+    'MAIN': ("主模式", "#88C0D0"),    # 蓝色
+    'MOUSE': ("鼠标", "#D08770"),     # 橙色
+    'BROWSER': ("浏览器", "#A3BE8C"), # 绿色
+    'MUSIC': ("音乐", "#B48EAD"),     # 紫色
+}
+
+# 手势名称 -> 中文显示
+_GESTURE_NAMES = {
+    'ONE': '1指',
+    'TWO': '2指',
+    'THREE': '3指',
+    'FOUR': '4指',
+    'FIST': '拳头',
+    'PALM': '手掌',
+    'ROCK': '🤘',
+    'THUMBS_UP': '👍'
+}
+
+# 音乐应用名称简写（一次编译的正则替代逐个子串查找）
+_MUSIC_APP_RE = re.compile(r'(NetEase|Spotify|QQ)')
+_MUSIC_APP_SHORT_NAMES = {
+    'NetEase': "网易云",
+    'Spotify': "Spotify",
+    'QQ': "QQ音乐",
+}
+
+
+class StatusSlot:
+    """状态槽（只保存最新的一条状态，新状态直接覆盖旧状态）"""
+    
+    def __init__(self):
+        """初始化状态槽"""
+        self._status = None
+        self._lock = threading.Lock()
+    
+    def put(self, status):
+        """
+        写入最新状态（不会阻塞，也不会因为积压而丢弃）
+        
+        Args:
+            status: 状态字典
+        """
+        with self._lock:
+            self._status = status
+    
+    def take(self):
+        """
+        取出最新状态
+        
+        Returns:
+            dict: 上次取出后写入的最新状态，没有新状态时返回None
+        """
+        with self._lock:
+            status, self._status = self._status, None
+        return status
+
 
 class StatusWindow:
     """悬浮状态窗口"""
     
-    def __init__(self, update_queue):
+    POLL_INTERVAL_MS = 100  # 状态槽轮询间隔（毫秒）
+    
+    def __init__(self, status_slot):
         """
         初始化悬浮窗口
         
         Args:
-            update_queue: 用于接收状态更新的队列
+            status_slot: 用于接收状态更新的StatusSlot
         """
-        self.update_queue = update_queue
+        self.status_slot = status_slot
         self.root = None
         self.is_running = False
-        self.mode_var = None
-        self.gesture_var = None
-        self.volume_var = None
-        self.brightness_var = None
-        self.music_var = None
+        self.mode_label = None
+        self.gesture_label = None
+        self.volume_label = None
+        self.brightness_label = None
+        self.music_label = None
+        self._label_state = {}  # 标签 -> (文本, 颜色)，用于跳过未变化的更新
         
     def _create_window(self):
         """创建悬浮窗口"""
@@ -87,37 +148,32 @@ class StatusWindow:
         # 模式（带图标）
         tk.Label(status_frame, text="🎯", font=('Segoe UI', 9), bg=bg_color, fg="#ECEFF4").grid(row=0, column=0, sticky=tk.W, padx=(0, 8))
         tk.Label(status_frame, text="模式:", font=('Segoe UI', 9), bg=bg_color, fg="#E5E9F0").grid(row=0, column=1, sticky=tk.W)
-        self.mode_var = tk.StringVar(value="主模式")
-        self.mode_value_label = tk.Label(status_frame, textvariable=self.mode_var, font=('Segoe UI', 9, 'bold'), bg=bg_color, fg="#88C0D0")
-        self.mode_value_label.grid(row=0, column=2, sticky=tk.E)
+        self.mode_label = tk.Label(status_frame, text="主模式", font=('Segoe UI', 9, 'bold'), bg=bg_color, fg="#88C0D0")
+        self.mode_label.grid(row=0, column=2, sticky=tk.E)
         
         # 手势（带图标）
         tk.Label(status_frame, text="👋", font=('Segoe UI', 9), bg=bg_color, fg="#ECEFF4").grid(row=1, column=0, sticky=tk.W, padx=(0, 8))
         tk.Label(status_frame, text="手势:", font=('Segoe UI', 9), bg=bg_color, fg="#E5E9F0").grid(row=1, column=1, sticky=tk.W)
-        self.gesture_var = tk.StringVar(value="-")
-        gesture_value = tk.Label(status_frame, textvariable=self.gesture_var, font=('Segoe UI', 9), bg=bg_color, fg="#EBCB8B")
-        gesture_value.grid(row=1, column=2, sticky=tk.E)
+        self.gesture_label = tk.Label(status_frame, text="-", font=('Segoe UI', 9), bg=bg_color, fg="#EBCB8B")
+        self.gesture_label.grid(row=1, column=2, sticky=tk.E)
         
         # 音量（带图标）
         tk.Label(status_frame, text="🔊", font=('Segoe UI', 9), bg=bg_color, fg="#ECEFF4").grid(row=2, column=0, sticky=tk.W, padx=(0, 8))
         tk.Label(status_frame, text="音量:", font=('Segoe UI', 9), bg=bg_color, fg="#E5E9F0").grid(row=2, column=1, sticky=tk.W)
-        self.volume_var = tk.StringVar(value="-")
-        volume_value = tk.Label(status_frame, textvariable=self.volume_var, font=('Segoe UI', 9), bg=bg_color, fg="#B48EAD")
-        volume_value.grid(row=2, column=2, sticky=tk.E)
+        self.volume_label = tk.Label(status_frame, text="-", font=('Segoe UI', 9), bg=bg_color, fg="#B48EAD")
+        self.volume_label.grid(row=2, column=2, sticky=tk.E)
         
         # 亮度（带图标）
         tk.Label(status_frame, text="☀️", font=('Segoe UI', 9), bg=bg_color, fg="#ECEFF4").grid(row=3, column=0, sticky=tk.W, padx=(0, 8))
         tk.Label(status_frame, text="亮度:", font=('Segoe UI', 9), bg=bg_color, fg="#E5E9F0").grid(row=3, column=1, sticky=tk.W)
-        self.brightness_var = tk.StringVar(value="-")
-        brightness_value = tk.Label(status_frame, textvariable=self.brightness_var, font=('Segoe UI', 9), bg=bg_color, fg="#BF616A")
-        brightness_value.grid(row=3, column=2, sticky=tk.E)
+        self.brightness_label = tk.Label(status_frame, text="-", font=('Segoe UI', 9), bg=bg_color, fg="#BF616A")
+        self.brightness_label.grid(row=3, column=2, sticky=tk.E)
         
         # 音乐状态（带图标）
         tk.Label(status_frame, text="🎵", font=('Segoe UI', 9), bg=bg_color, fg="#ECEFF4").grid(row=4, column=0, sticky=tk.W, padx=(0, 8))
         tk.Label(status_frame, text="音乐:", font=('Segoe UI', 9), bg=bg_color, fg="#E5E9F0").grid(row=4, column=1, sticky=tk.W)
-        self.music_var = tk.StringVar(value="未播放")
-        music_value = tk.Label(status_frame, textvariable=self.music_var, font=('Segoe UI', 8), bg=bg_color, fg="#D08770")
-        music_value.grid(row=4, column=2, sticky=tk.E)
+        self.music_label = tk.Label(status_frame, text="未播放", font=('Segoe UI', 8), bg=bg_color, fg="#D08770")
+        self.music_label.grid(row=4, column=2, sticky=tk.E)
         
         # 添加一些间距
         for i in range(5):
@@ -151,9 +207,8 @@ class StatusWindow:
         self.is_running = True
         self._create_window()
         
-        # 启动更新线程
-        update_thread = threading.Thread(target=self._update_loop, daemon=True)
-        update_thread.start()
+        # 在Tk事件循环中轮询状态槽（Tkinter非线程安全，控件只能在本线程中更新）
+        self.root.after(self.POLL_INTERVAL_MS, self._poll_status)
         
         # 启动Tkinter主循环
         self.root.mainloop()
@@ -167,20 +222,21 @@ class StatusWindow:
         if self.root:
             self.root.quit()
             
-    def _update_loop(self):
-        """后台更新循环"""
-        while self.is_running:
+    def _poll_status(self):
+        """轮询状态槽（由Tk事件循环调度）"""
+        if not self.is_running:
+            return
+            
+        # 状态槽中只有最新的一条
+        status = self.status_slot.take()
+        if status is not None:
             try:
-                # 从队列获取更新（超时1秒）
-                try:
-                    status = self.update_queue.get(timeout=1)
-                    self._update_display(status)
-                except queue.Empty:
-                    pass
-                    
+                self._update_display(status)
             except Exception as e:
                 print(f"Status window update error: {e}")
                 
+        self.root.after(self.POLL_INTERVAL_MS, self._poll_status)
+                
     def _update_display(self, status):
         """
         更新显示内容
@@ -191,85 +247,77 @@ class StatusWindow:
         if not self.root:
             return
             
-        # 更新模式（带颜色编码）
+        # 更新模式（带颜色编码，未知模式显示原名+默认蓝色）
         mode = status.get('mode', 'MAIN')
-        mode_text = mode
-        mode_color = "#88C0D0"  # 默认蓝色
-        
-        if mode == 'BROWSER':
-            mode_text = "浏览器"
-            mode_color = "#A3BE8C"  # 绿色
-        elif mode == 'MUSIC':
-            mode_text = "音乐"
-            mode_color = "#B48EAD"  # 紫色
-        elif mode == 'MOUSE':
-            mode_text = "鼠标"
-            mode_color = "#D08770"  # 橙色
-        elif mode == 'MAIN':
-            mode_text = "主模式"
-            mode_color = "#88C0D0"  # 蓝色
+        mode_text, mode_color = _MODE_STYLES.get(mode, (mode, "#88C0D0"))
             
-        self.mode_var.set(mode_text)
-        # 更新模式颜色
-        self.mode_value_label.config(fg=mode_color)
-        
-        # 更新手势
+        # 更新手势（将手势名称转换为中文显示）
         gesture = status.get('gesture', '-')
         if gesture and gesture != '-':
-            # 将手势名称转换为中文显示
-            gesture_map = {
-                'ONE': '1指',
-                'TWO': '2指', 
-                'THREE': '3指',
-                'FOUR': '4指',
-                'FIST': '拳头',
-                'PALM': '手掌',
-                'ROCK': '🤘',
-                'THUMBS_UP': '👍'
-            }
-            display_gesture = gesture_map.get(gesture, gesture)
-            self.gesture_var.set(display_gesture)
+            gesture_text = _GESTURE_NAMES.get(gesture, gesture)
         else:
-            self.gesture_var.set('-')
+            gesture_text = '-'
             
         # 更新音量
         volume = status.get('volume', '-')
-        if volume and volume != '-':
-            self.volume_var.set(f"{volume}")
-        else:
-            self.volume_var.set('-')
+        volume_text = f"{volume}" if volume and volume != '-' else '-'
             
         # 更新亮度
         brightness = status.get('brightness', '-')
-        if brightness and brightness != '-':
-            self.brightness_var.set(f"{brightness}")
-        else:
-            self.brightness_var.set('-')
+        brightness_text = f"{brightness}" if brightness and brightness != '-' else '-'
             
         # 更新音乐状态
         music_app = status.get('music_app', None)
         if music_app:
-            # 简化应用名称
-            app_short = music_app
-            if 'NetEase' in music_app:
-                app_short = "网易云"
-            elif 'Spotify' in music_app:
-                app_short = "Spotify"
-            elif 'QQ' in music_app:
-                app_short = "QQ音乐"
-            else:
-                app_short = music_app[:8]  # 截取前8个字符
-            self.music_var.set(f"{app_short}")
+            # 简化应用名称（未知应用截取前8个字符）
+            match = _MUSIC_APP_RE.search(music_app)
+            music_text = _MUSIC_APP_SHORT_NAMES[match.group(1)] if match else music_app[:8]
         else:
-            self.music_var.set("未播放")
+            music_text = "未播放"
+            
+        # 先集中提交所有变化，再统一处理一次重绘
+        changed = self._set_label(self.mode_label, mode_text, mode_color)
+        changed |= self._set_label(self.gesture_label, gesture_text)
+        changed |= self._set_label(self.volume_label, volume_text)
+        changed |= self._set_label(self.brightness_label, brightness_text)
+        changed |= self._set_label(self.music_label, music_text)
+        
+        if changed:
+            self.root.update_idletasks()
+            
+    def _set_label(self, label, text, fg=None):
+        """
+        仅在内容变化时更新标签（文本和颜色合并为一次configure调用）
+        
+        Args:
+            label: 要更新的标签
+            text: 显示文本
+            fg: 前景色，None表示不修改
+            
+        Returns:
+            bool: 是否发生了更新
+        """
+        last_text, last_fg = self._label_state.get(label, (None, None))
+        options = {}
+        if text != last_text:
+            options['text'] = text
+        if fg is not None and fg != last_fg:
+            options['fg'] = fg
+            
+        if not options:
+            return False
+            
+        label.configure(**options)
+        self._label_state[label] = (text, fg if fg is not None else last_fg)
+        return True
 
 
-def start_status_window(update_queue):
+def start_status_window(status_slot):
     """
     启动状态窗口（在独立线程中）
     
     Args:
-        update_queue: 用于接收状态更新的队列
+        status_slot: 用于接收状态更新的StatusSlot
     """
-    window = StatusWindow(update_queue)
+    window = StatusWindow(status_slot)
     window.start()
@@ -6,13 +6,8 @@
 import cv2
 import numpy as np
 import time
-from datetime import datetime
 import os
-import sys
-import os as os_import
-
-# 添加父目录到路径
-sys.path.append(os_import.path.dirname(os_import.path.dirname(os_import.path.abspath(__file__))))
+import re
 
 try:
     from config import FONT_NAME, FONT_SCALE, FONT_COLOR, FONT_THICKNESS, DEBUG_MODE
@@ -28,22 +23,33 @@ except Exception:
 
 
 class FPSCounter:
-    """FPS计数器"""
+    """FPS计数器（单调时钟 + 指数移动平均）"""
     
-    def __init__(self):
-        self.start_time = time.time()
-        self.frame_count = 0
-        self.fps = 0
+    def __init__(self, smoothing=0.9):
+        """
+        初始化FPS计数器
+        
+        Args:
+            smoothing: 平滑系数，越大FPS变化越平缓
+        """
+        self.smoothing = smoothing
+        self.last_time = time.perf_counter()
+        self.fps = 0.0
     
     def update(self):
         """更新FPS"""
-        self.frame_count += 1
-        current_time = time.time()
+        current_time = time.perf_counter()
+        elapsed = current_time - self.last_time
+        self.last_time = current_time
+        
+        if elapsed <= 1e-9:
+            return
         
-        if current_time - self.start_time >= 1.0:
-            self.fps = self.frame_count / (current_time - self.start_time)
-            self.frame_count = 0
-            self.start_time = current_time
+        instant_fps = 1.0 / elapsed
+        if self.fps:
+            self.fps = self.smoothing * self.fps + (1.0 - self.smoothing) * instant_fps
+        else:
+            self.fps = instant_fps
 
 
 def create_screenshot_directory(path):
@@ -56,6 +62,10 @@ def create_screenshot_directory(path):
     os.makedirs(path, exist_ok=True)
 
 
+# 时间戳缓存: [秒, 格式化字符串]
+_TIMESTAMP_CACHE = [0, ""]
+
+
 def get_timestamp_filename(prefix="screenshot", extension="png"):
     """
     生成带时间戳的文件名
@@ -67,17 +77,93 @@ def get_timestamp_filename(prefix="screenshot", extension="png"):
     Returns:
         str: 文件名
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"{prefix}_{timestamp}.{extension}"
+    # 同一秒内复用已格式化的时间戳
+    sec = int(time.time())
+    if sec != _TIMESTAMP_CACHE[0]:
+        _TIMESTAMP_CACHE[:] = [sec, time.strftime("%Y%m%d_%H%M%S", time.localtime(sec))]
+    return f"{prefix}_{_TIMESTAMP_CACHE[1]}.{extension}"
 
 
-def is_browser_active():
+# 前台窗口检测结果的缓存有效期（秒）
+DETECTION_CACHE_TTL = 0.5
+# pid -> 进程名缓存的有效期（秒），pid被系统复用后最多这么久就会重新查询
+PROCESS_NAME_CACHE_TTL = 5.0
+
+_browser_cache = {"time": None, "value": (False, None)}
+_music_cache = {"time": None, "value": (False, None)}
+_process_names = {}  # pid -> (缓存时间, 小写进程名)
+
+# 浏览器进程名 -> 显示名称
+_BROWSER_NAMES = {
+    'chrome.exe': 'Chrome',         # Google Chrome
+    'firefox.exe': 'Firefox',       # Mozilla Firefox
+    'msedge.exe': 'Edge',           # Microsoft Edge
+    'safari.exe': 'Safari',         # Safari
+    'opera.exe': 'Opera',           # Opera
+    'brave.exe': 'Brave',           # Brave
+    'vivaldi.exe': 'Vivaldi'        # Vivaldi
+}
+_BROWSER_PROCESSES = frozenset(_BROWSER_NAMES)
+
+# 音乐软件进程名 -> 显示名称
+_MUSIC_APPS = {
+    'cloudmusic.exe': 'NetEase Cloud Music',
+    'spotify.exe': 'Spotify',
+    'qqmusic.exe': 'QQ Music',
+    'foobar2000.exe': 'Foobar2000',
+    'vlc.exe': 'VLC Media Player',
+    'winamp.exe': 'Winamp'
+}
+
+# 窗口标题关键词（小写） -> 音乐软件名称，编译为单个正则一次扫描完成
+_MUSIC_TITLE_KEYWORDS = {
+    '网易云音乐': 'NetEase Cloud Music',
+    'netease': 'NetEase Cloud Music',
+}
+_MUSIC_TITLE_RE = re.compile('|'.join(map(re.escape, _MUSIC_TITLE_KEYWORDS)), re.IGNORECASE)
+
+
+def _get_process_name(pid):
     """
-    检测当前活动窗口是否是浏览器
+    获取进程名称（按pid短时缓存，避免重复构造psutil.Process）
     
+    Args:
+        pid: 进程ID
+        
     Returns:
-        bool: 如果是浏览器返回True，否则返回False
+        str: 小写的进程名称
     """
+    now = time.monotonic()
+    cached = _process_names.get(pid)
+    if cached is not None and now - cached[0] < PROCESS_NAME_CACHE_TTL:
+        return cached[1]
+    
+    import psutil
+    process_name = psutil.Process(pid).name().lower()
+    # pid会被系统复用，条目过期后重新查询；缓存过大时直接清空
+    if len(_process_names) >= 64:
+        _process_names.clear()
+    _process_names[pid] = (now, process_name)
+    return process_name
+
+
+def _is_cache_fresh(cache, now):
+    """判断检测缓存是否仍在有效期内"""
+    return cache["time"] is not None and now - cache["time"] < DETECTION_CACHE_TTL
+
+
+def _detect_browser():
+    """
+    检测前台窗口的浏览器状态（带缓存）
+    
+    Returns:
+        tuple: (bool:是否是浏览器活动窗口, str:浏览器名称)
+    """
+    now = time.monotonic()
+    if _is_cache_fresh(_browser_cache, now):
+        return _browser_cache["value"]
+    
+    result = (False, None)
     try:
         import win32gui
         import win32process
@@ -85,44 +171,38 @@ def is_browser_active():
         
         # 获取当前活动窗口句柄
         hwnd = win32gui.GetForegroundWindow()
-        if not hwnd:
-            return False
-        
-        # 获取窗口标题
-        window_title = win32gui.GetWindowText(hwnd)
-        if not window_title:
-            return False
-        
-        # 获取进程ID
-        _, pid = win32process.GetWindowThreadProcessId(hwnd)
-        if not pid:
-            return False
-        
-        try:
-            # 获取进程名称
-            process = psutil.Process(pid)
-            process_name = process.name().lower()
-            
-            # 检查是否是浏览器进程
-            browser_processes = [
-                'chrome.exe',      # Google Chrome
-                'firefox.exe',     # Mozilla Firefox
-                'msedge.exe',      # Microsoft Edge
-                'safari.exe',      # Safari
-                'opera.exe',       # Opera
-                'brave.exe',       # Brave
-                'vivaldi.exe'      # Vivaldi
-            ]
-            
-            return process_name in browser_processes
-            
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return False
-            
+        if hwnd:
+            # 获取进程ID
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            if pid:
+                try:
+                    # 检查是否是浏览器进程
+                    process_name = _get_process_name(pid)
+                    if process_name in _BROWSER_PROCESSES:
+                        # 没有标题的窗口不视为活动的浏览器
+                        is_active = bool(win32gui.GetWindowText(hwnd))
+                        result = (is_active, _BROWSER_NAMES[process_name])
+                    
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+                    
     except Exception as e:
         if DEBUG_MODE:
             print(f"Browser detection error: {e}")
-        return False
+    
+    _browser_cache["time"] = now
+    _browser_cache["value"] = result
+    return result
+
+
+def is_browser_active():
+    """
+    检测当前活动窗口是否是浏览器
+    
+    Returns:
+        bool: 如果是浏览器返回True，否则返回False
+    """
+    return _detect_browser()[0]
 
 
 def get_browser_name():
@@ -132,46 +212,27 @@ def get_browser_name():
     Returns:
         str: 浏览器名称，如果不是浏览器返回None
     """
-    try:
-        import win32gui
-        import win32process
-        import psutil
-        
-        hwnd = win32gui.GetForegroundWindow()
-        if not hwnd:
-            return None
-        
-        _, pid = win32process.GetWindowThreadProcessId(hwnd)
-        if not pid:
-            return None
-        
-        try:
-            process = psutil.Process(pid)
-            process_name = process.name().lower()
-            
-            browser_names = {
-                'chrome.exe': 'Chrome',
-                'firefox.exe': 'Firefox',
-                'msedge.exe': 'Edge',
-                'safari.exe': 'Safari',
-                'opera.exe': 'Opera',
-                'brave.exe': 'Brave',
-                'vivaldi.exe': 'Vivaldi'
-            }
-            
-            return browser_names.get(process_name)
-            
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return None
-            
-    except Exception:
-        return None
+    return _detect_browser()[1]
 
 
 def is_music_playing():
     """
     检测是否有音乐正在播放（支持网易云音乐等）
     
+    Returns:
+        tuple: (bool:是否正在播放, str:音乐软件名称)
+    """
+    now = time.monotonic()
+    if not _is_cache_fresh(_music_cache, now):
+        _music_cache["value"] = _detect_music()
+        _music_cache["time"] = now
+    return _music_cache["value"]
+
+
+def _detect_music():
+    """
+    检测音乐播放状态（无缓存）
+    
     Returns:
         tuple: (bool:是否正在播放, str:音乐软件名称)
     """
@@ -187,32 +248,31 @@ def is_music_playing():
             
             for session in sessions:
                 if session.State and session.State == 1:  # 1 = Active
-                    if session.Process:
-                        process_name = session.Process.name().lower()
-                        # 检查是否是音乐软件
-                        music_apps = {
-                            'cloudmusic.exe': 'NetEase Cloud Music',
-                            'spotify.exe': 'Spotify',
-                            'qqmusic.exe': 'QQ Music',
-                            'foobar2000.exe': 'Foobar2000',
-                            'vlc.exe': 'VLC Media Player',
-                            'winamp.exe': 'Winamp'
-                        }
-                        
-                        if process_name in music_apps:
-                            return True, music_apps[process_name]
+                    # 直接用会话的pid查缓存的进程名，不为每个会话构造psutil.Process
+                    pid = session.ProcessId
+                    if not pid:
+                        continue
+                    try:
+                        process_name = _get_process_name(pid)
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue
+                    
+                    # 检查是否是音乐软件
+                    if process_name in _MUSIC_APPS:
+                        return True, _MUSIC_APPS[process_name]
         except:
             pass
         
         # 备选方案：检查活跃窗口标题是否包含播放指示
         hwnd = win32gui.GetForegroundWindow()
         if hwnd:
-            window_title = win32gui.GetWindowText(hwnd).lower()
+            window_title = win32gui.GetWindowText(hwnd)
             
             # 网易云音乐的播放状态通常会在标题中显示
-            if '网易云音乐' in window_title or 'netease' in window_title:
-                # 检查是否有播放相关的标题变化（这只是一个启发式检测）
-                return True, 'NetEase Cloud Music'
+            # 检查是否有播放相关的标题变化（这只是一个启发式检测）
+            match = _MUSIC_TITLE_RE.search(window_title)
+            if match:
+                return True, _MUSIC_TITLE_KEYWORDS[match.group(0).lower()]
         
         return False, None
         
@@ -8,13 +8,14 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import subprocess
 import sys
-import threading
 from typing import Optional
 
 
 class GestureControlLauncher:
     """手势控制启动器"""
     
+    PROCESS_POLL_INTERVAL_MS = 200  # 主程序进程状态轮询间隔（毫秒）
+    
     def __init__(self):
         self.root = None
         self.main_process: Optional[subprocess.Popen] = None
@@ -150,36 +151,40 @@ class GestureControlLauncher:
             messagebox.showwarning("警告", "手势控制系统已经在运行中！")
             return
             
-        def run_main():
-            try:
-                # 构建启动参数
-                args = [sys.executable, 'main.py']
-                if not self.camera_preview_var.get():
-                    args.append('--no-viz')
-                
-                # 启动主程序
-                self.main_process = subprocess.Popen(args)
-                
-                self.is_running = True
-                self.root.after(0, self._update_status_running)
-                
-                # 等待进程结束
-                self.main_process.wait()
-                
-                self.is_running = False
-                self.root.after(0, self._update_status_stopped)
-                
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("错误", f"启动失败: {e}"))
-                self.is_running = False
-                self.root.after(0, self._update_status_stopped)
-        
-        # 在新线程中运行
-        thread = threading.Thread(target=run_main, daemon=True)
-        thread.start()
-        
         self._update_status_starting()
         
+        try:
+            # 构建启动参数
+            args = [sys.executable, 'main.py']
+            if not self.camera_preview_var.get():
+                args.append('--no-viz')
+            
+            # 启动主程序（不阻塞，进程状态由Tk事件循环轮询）
+            self.main_process = subprocess.Popen(args)
+            
+        except Exception as e:
+            messagebox.showerror("错误", f"启动失败: {e}")
+            self.is_running = False
+            self._update_status_stopped()
+            return
+        
+        self.is_running = True
+        self._update_status_running()
+        self.root.after(self.PROCESS_POLL_INTERVAL_MS, self._poll_process)
+        
+    def _poll_process(self) -> None:
+        """轮询主程序进程是否已结束"""
+        if not self.is_running or self.main_process is None:
+            return
+        
+        if self.main_process.poll() is None:
+            self.root.after(self.PROCESS_POLL_INTERVAL_MS, self._poll_process)
+            return
+        
+        self.is_running = False
+        self.main_process = None
+        self._update_status_stopped()
+        
     def _stop_gesture_control(self) -> None:
         """停止手势控制系统"""
         if self.main_process and self.is_running:
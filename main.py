@@ -3,50 +3,206 @@ import time
 import argparse
 import sys
 import os
-import queue
 import threading
-import json
+import queue
+import logging
+import logging.handlers
+from dataclasses import fields
 
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+_PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
-from config import *
-from gesture_controller import HandTracker, GestureRecognizer, ActionExecutor, FPSCounter
-from gesture_controller.utils import is_browser_active, get_browser_name, is_music_playing, get_music_app_name
-from gesture_controller.status_window import start_status_window
+from config import (
+    CAMERA_INDEX, CAMERA_WIDTH, CAMERA_HEIGHT, CAMERA_FOURCC, DISPLAY_FPS,
+    MAX_NUM_HANDS, MIN_DETECTION_CONFIDENCE, MIN_TRACKING_CONFIDENCE,
+    USE_GPU_DELEGATE, INFERENCE_INTERVAL, INFERENCE_WIDTH, INFERENCE_HEIGHT, PIN_CPU_COUNT,
+    DEBUG_MODE, UserSettings, json_loads
+)
+from gesture_controller import HandTracker, GestureRecognizer, ActionExecutor, FPSCounter, FrameGrabber, EnvironmentWatcher, DisplayThread, AutoModeSwitcher
+from gesture_controller.status_window import StatusSlot, start_status_window
 
-def load_user_settings():
-    """加载用户设置"""
-    settings_file = "user_settings.json"
-    default_settings = {
-        "mouse_sensitivity": 8.0,
-        "volume_step": 0.05,
-        "brightness_step": 10,
-        "gesture_cooldown": 0.5,
-        "scroll_speed": 5,
-        "ui_primary_color": (0, 150, 255),
-        "ui_background_color": (30, 30, 40)
-    }
+# 主循环日志（经队列交给后台线程输出，主循环不直接写终端）
+log = logging.getLogger("gesture_control")
+
+# 设置文件缓存: 文件修改时间未变时直接返回上次解析的结果
+_settings_cache = {"mtime": None, "settings": None}
+
+def load_user_settings(settings_file="user_settings.json"):
+    """
+    加载用户设置
     
+    Args:
+        settings_file: 设置文件路径
+        
+    Returns:
+        UserSettings: 用户设置（文件不存在或读取失败时为默认值）
+    """
     try:
-        if os.path.exists(settings_file):
-            with open(settings_file, 'r', encoding='utf-8') as f:
-                user_settings = json.load(f)
-                # 合并设置，保留用户自定义的，使用默认值补充缺失的
-                for key, value in default_settings.items():
-                    if key not in user_settings:
-                        user_settings[key] = value
-                return user_settings
+        mtime = os.stat(settings_file).st_mtime
+    except OSError:
+        return UserSettings()
+    
+    if _settings_cache["settings"] is not None and _settings_cache["mtime"] == mtime:
+        return _settings_cache["settings"]
+    
+    try:
+        with open(settings_file, 'rb') as f:
+            loaded = json_loads(f.read())
+        # 只取已知的设置项，其余项（界面主题等）由设置界面使用
+        known = {item.name for item in fields(UserSettings)}
+        settings = UserSettings(**{k: v for k, v in loaded.items() if k in known})
     except Exception as e:
         print(f"加载用户设置失败: {e}")
+        return UserSettings()
+    
+    _settings_cache["mtime"] = mtime
+    _settings_cache["settings"] = settings
+    return settings
+
+def setup_logging(debug=False):
+    """
+    配置主循环日志
+    
+    每帧可能出现的调试信息放入队列，由QueueListener线程写到终端；
+    INFO及以上的消息很少出现，直接同步输出，
+    保证与toggle_mode、ActionExecutor中直接print的内容顺序一致
+    
+    Args:
+        debug: 是否输出调试信息
+        
+    Returns:
+        logging.handlers.QueueListener: 日志输出线程（退出前需调用stop()）
+    """
+    formatter = logging.Formatter("%(message)s")
+    log_queue = queue.Queue(-1)
+    queued = logging.StreamHandler(sys.stdout)
+    queued.setFormatter(formatter)
+    listener = logging.handlers.QueueListener(log_queue, queued)
+    
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(lambda record: record.levelno < logging.INFO)
+    direct = logging.StreamHandler(sys.stdout)
+    direct.setLevel(logging.INFO)
+    direct.setFormatter(formatter)
+    
+    log.addHandler(queue_handler)
+    log.addHandler(direct)
+    log.setLevel(logging.DEBUG if debug else logging.INFO)
+    log.propagate = False
+    
+    listener.start()
+    return listener
+
+def get_camera_backend():
+    """选择低延迟的摄像头后端"""
+    if sys.platform.startswith('win'):
+        return cv2.CAP_DSHOW
+    if sys.platform.startswith('linux'):
+        return cv2.CAP_V4L2
+    return cv2.CAP_ANY
+
+def poll_key():
+    """
+    非阻塞读取按键（OpenCV 4.5+ 使用pollKey，不再每帧固定等待1ms）
+    
+    Returns:
+        int: 按键码（低8位），无按键时为255
+    """
+    if hasattr(cv2, 'pollKey'):
+        k = cv2.pollKey()
+    else:
+        k = cv2.waitKey(1)
+    return (k & 0xFF) if k != -1 else 255
+
+def poll_stdin_key():
+    """
+    非阻塞读取终端按键（--no-viz时使用，不依赖OpenCV窗口）
+    
+    Windows下直接读取按键；其他系统终端为行缓冲，需输入字母后回车
+    
+    Returns:
+        int: 按键码（低8位），无按键时为255
+    """
+    if sys.stdin is None or not sys.stdin.isatty():
+        return 255
+    
+    if sys.platform.startswith('win'):
+        import msvcrt
+        if msvcrt.kbhit():
+            return ord(msvcrt.getwch()) & 0xFF
+        return 255
+    
+    import select
+    readable, _, _ = select.select([sys.stdin], [], [], 0)
+    if readable:
+        ch = sys.stdin.read(1)
+        if ch and not ch.isspace():
+            return ord(ch) & 0xFF
+    return 255
+
+def pin_process_cores(cpu_count):
+    """
+    将进程绑定到前几个逻辑CPU并提高调度优先级
+    
+    Intel混合架构会先编号性能核，因此前几个逻辑CPU通常就是P核
+    
+    Args:
+        cpu_count: 绑定的逻辑CPU数量
+    """
+    import psutil
+    process = psutil.Process()
+    
+    try:
+        cpus = sorted(process.cpu_affinity())[:cpu_count]
+        process.cpu_affinity(cpus)
+        print(f"  CPU绑定: {cpus}")
+    except (AttributeError, psutil.Error, OSError) as e:
+        # macOS不支持设置CPU亲和性
+        print(f"  提示: 无法绑定CPU ({e})")
     
-    return default_settings
+    try:
+        if sys.platform.startswith('win'):
+            process.nice(psutil.HIGH_PRIORITY_CLASS)
+        else:
+            process.nice(-5)  # 需要相应权限
+        print("  进程优先级: 已提高")
+    except (psutil.Error, OSError) as e:
+        print(f"  提示: 无法提高进程优先级 ({e})")
+
+def fourcc_arg(value):
+    """
+    解析--fourcc参数（空字符串或恰好4个字符）
+    
+    Args:
+        value: 命令行传入的像素格式
+        
+    Returns:
+        str: 转为大写的像素格式
+    """
+    value = value.upper()
+    if value and len(value) != 4:
+        raise argparse.ArgumentTypeError(f"像素格式必须是4个字符（如MJPG），或传空字符串: {value!r}")
+    return value
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--camera", type=int, default=CAMERA_INDEX)
     parser.add_argument("--width", type=int, default=CAMERA_WIDTH)
     parser.add_argument("--height", type=int, default=CAMERA_HEIGHT)
+    parser.add_argument("--infer-width", type=int, default=INFERENCE_WIDTH,
+                        help="手部推理输入最大宽度（保持摄像头画面宽高比缩放）")
+    parser.add_argument("--infer-height", type=int, default=INFERENCE_HEIGHT,
+                        help="手部推理输入最大高度")
+    parser.add_argument("--fourcc", type=fourcc_arg, default=CAMERA_FOURCC,
+                        help="摄像头像素格式（如MJPG、YUYV），传空字符串使用驱动默认格式")
     parser.add_argument("--no-viz", action="store_true")
+    parser.add_argument("--no-draw-landmarks", action="store_true",
+                        help="预览窗口中不绘制手部关键点（--no-viz时自动关闭）")
+    parser.add_argument("--pin-cores", action="store_true",
+                        help="将进程绑定到性能核并提高优先级")
+    parser.add_argument("--no-auto-browser", dest="auto_browser", action="store_false",
+                        help="关闭浏览器自动检测")
     args = parser.parse_args()
     
     # 加载用户设置
@@ -56,16 +212,20 @@ def main():
     print("手势控制系统")
     print("=" * 60)
     print("初始化组件...")
-    print(f"  鼠标灵敏度: {user_settings['mouse_sensitivity']}")
-    print(f"  音量调节步长: {user_settings['volume_step']}")
-    print(f"  亮度调节步长: {user_settings['brightness_step']}")
-    print(f"  手势冷却时间: {user_settings['gesture_cooldown']}秒")
+    print(f"  鼠标灵敏度: {user_settings.mouse_sensitivity}")
+    print(f"  音量调节步长: {user_settings.volume_step}")
+    print(f"  亮度调节步长: {user_settings.brightness_step}")
+    print(f"  手势冷却时间: {user_settings.gesture_cooldown}秒")
     
     try:
         hand_tracker = HandTracker(
             max_num_hands=MAX_NUM_HANDS,
             min_detection_confidence=MIN_DETECTION_CONFIDENCE,
-            min_tracking_confidence=MIN_TRACKING_CONFIDENCE
+            min_tracking_confidence=MIN_TRACKING_CONFIDENCE,
+            use_gpu=USE_GPU_DELEGATE,
+            inference_interval=INFERENCE_INTERVAL,
+            inference_size=(args.infer_width, args.infer_height),
+            mirror=True
         )
         
         gesture_recognizer = GestureRecognizer()
@@ -73,19 +233,24 @@ def main():
         fps_counter = FPSCounter()
         
         # 应用用户设置
-        action_executor.set_mouse_sensitivity(user_settings['mouse_sensitivity'])
-        action_executor.set_volume_step(user_settings['volume_step'])
-        action_executor.set_brightness_step(user_settings['brightness_step'])
-        action_executor.set_scroll_speed(user_settings['scroll_speed'])
-        gesture_recognizer.set_cooldown(user_settings['gesture_cooldown'])
+        action_executor.set_mouse_sensitivity(user_settings.mouse_sensitivity)
+        action_executor.set_volume_step(user_settings.volume_step)
+        action_executor.set_brightness_step(user_settings.brightness_step)
+        action_executor.set_scroll_speed(user_settings.scroll_speed)
+        gesture_recognizer.set_cooldown(user_settings.gesture_cooldown)
+        hand_tracker.set_visualization(not args.no_viz)
+        hand_tracker.set_draw_landmarks(not (args.no_viz or args.no_draw_landmarks))
         
         print("✓ 组件初始化成功")
+        
+        if args.pin_cores:
+            pin_process_cores(PIN_CPU_COUNT)
         print(f"  音量控制: {'可用' if action_executor.volume_interface else '不可用'}")
         
         # 启动状态悬浮窗
         print("\n启动状态窗口...")
-        status_queue = queue.Queue()
-        status_thread = threading.Thread(target=start_status_window, args=(status_queue,), daemon=True)
+        status_slot = StatusSlot()
+        status_thread = threading.Thread(target=start_status_window, args=(status_slot,), daemon=True)
         status_thread.start()
         print("✓ 状态窗口已启动 (右键关闭)")
         
@@ -93,17 +258,37 @@ def main():
         print(f"✗ Failed to initialize components: {e}")
         return
     
-    cap = cv2.VideoCapture(args.camera)
+    cap = cv2.VideoCapture(args.camera, get_camera_backend())
     if not cap.isOpened():
         print(f"✗ Failed to open camera {args.camera}")
         return
     
+    # 请求指定像素格式（默认MJPEG，由摄像头压缩以降低USB带宽；需在设置分辨率之前）
+    if args.fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*args.fourcc))
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, args.width)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, args.height)
     cap.set(cv2.CAP_PROP_FPS, 30)
+    # 驱动只缓存1帧，减少延迟
+    if not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+        print("  提示: 摄像头不支持设置缓冲区大小")
     
     print(f"✓ 摄像头已打开: {args.camera}")
-    print(f"  分辨率: {args.width}x{args.height}")
+    print(f"  分辨率: {args.width}x{args.height} (推理上限: {args.infer_width}x{args.infer_height})")
+    # VideoCapture不是线程安全的，属性需在采集线程启动前读取
+    fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+    if fourcc:
+        fourcc_name = ''.join(chr((fourcc >> 8 * i) & 0xFF) for i in range(4))
+        print(f"  像素格式: {fourcc_name}")
+        if args.fourcc and fourcc_name != args.fourcc:
+            print(f"  提示: 摄像头未接受请求的像素格式 {args.fourcc}")
+    else:
+        # 部分后端不报告像素格式，无法判断请求是否生效
+        print("  像素格式: 未知")
+    
+    # 后台线程持续采集，主循环只取最新帧（此后只有采集线程访问cap）
+    grabber = FrameGrabber(cap)
+    grabber.start()
     
     print("\n" + "=" * 60)
     print("Control Instructions:")
@@ -116,82 +301,89 @@ def main():
     
     print("\n启动主循环...")
     print("(按 'q' 退出, 'r' 重置)")
-    print("浏览器自动检测: 已启用")
+    print(f"浏览器自动检测: {'已启用' if args.auto_browser else '已关闭'}")
     print("状态窗口: 右键关闭, 拖动移动")
     
     # 初始化状态更新相关变量
-    main.last_status_update = 0
+    last_status_update = 0.0
+    last_status_key = None
+    last_status_info = None
+    status_levels = ('-', '-')  # (音量, 亮度)
+    
+    # 主循环的输出走日志（调试信息经队列输出）；调试开关在循环外求值一次
+    log_listener = setup_logging(DEBUG_MODE)
+    log_debug = log.isEnabledFor(logging.DEBUG)
+    
+    # 预览窗口限速（按固定节拍推进下一次显示时间，摄像头帧间隔的抖动不会拉低刷新率）
+    display_interval = 1.0 / DISPLAY_FPS
+    next_show = 0.0
+    
+    # 预览窗口交给独立线程刷新（macOS的窗口只能在主线程操作，仍在主循环中显示）
+    display = None
+    if not args.no_viz and sys.platform != 'darwin':
+        display = DisplayThread("Gesture Control System", fps=DISPLAY_FPS)
+        display.start()
+    
+    # 按键来源在循环外确定（预览线程 / OpenCV窗口 / 终端）
+    if display:
+        read_key = display.get_key
+    elif args.no_viz:
+        read_key = poll_stdin_key
+    else:
+        read_key = poll_key
+    
+    # 显示函数同样在循环外确定，无预览时为None（循环内不再判断args.no_viz和display）
+    if args.no_viz:
+        show_frame = None
+    elif display:
+        show_frame = display.show
+    else:
+        show_frame = lambda image: cv2.imshow("Gesture Control System", image)
+    
+    def reset_recognizer():
+        log.info("重置识别器...")
+        gesture_recognizer.reset()
+    
+    def take_screenshot():
+        log.info("手动截图...")
+        action_executor.execute_action("screenshot")
+    
+    # 按键 -> 处理函数（退出需要跳出主循环，单独判断）
+    quit_key = ord('q')
+    key_actions = {
+        ord('r'): reset_recognizer,
+        ord('s'): take_screenshot,
+    }
     
-    # 浏览器检测相关变量
-    last_browser_check = 0
-    browser_check_interval = 2.0  # 每2秒检查一次浏览器
-    last_known_mode = "MAIN"  # 记录上一次的非自动切换的模式
+    # 音乐/浏览器检测交给后台线程（音乐每1秒、浏览器每2秒），状态变化时推送事件
+    env_watcher = EnvironmentWatcher(music_interval=1.0, browser_interval=2.0,
+                                     watch_browser=args.auto_browser)
+    env_watcher.start()
+    auto_mode = AutoModeSwitcher(gesture_recognizer, action_executor, auto_browser=args.auto_browser)
     
-    # 音乐检测相关变量
-    last_music_check = 0
-    music_check_interval = 1.0  # 每1秒检查一次音乐播放状态
-    music_mode_override = False  # 音乐模式是否覆盖其他模式
+    # 上一次推理得到的关键点及对应的手指状态
+    last_landmarks = None
+    last_finger_states = None
     
     try:
         while True:
-            current_time = time.time()
-            music_playing = False
-            music_app_name = None
+            current_time = time.monotonic()  # 只用于节流计时，不受系统时间调整影响
             
-            # 定期检测音乐播放状态（优先级最高）
-            if current_time - last_music_check >= music_check_interval:
-                last_music_check = current_time
-                
-                music_playing, music_app_name = is_music_playing()
-                current_mode = gesture_recognizer.mode
-                
-                if music_playing and current_mode != "MUSIC":
-                    # 检测到音乐播放且当前不在音乐模式，自动切换到音乐模式
-                    if not music_mode_override:  # 如果当前不是被音乐模式覆盖的状态
-                        last_known_mode = current_mode  # 保存当前模式
-                        music_mode_override = True
-                    gesture_recognizer.toggle_mode(target_mode="MUSIC")
-                    print(f"\n[自动] 检测到音乐: {music_app_name}")
-                    print("[自动] 切换到 音乐模式 (覆盖)")
-                    
-            elif not music_playing and current_mode == "MUSIC":
-                # 音乐停止播放且当前在音乐模式，恢复之前模式
-                music_mode_override = False
-                gesture_recognizer.toggle_mode(target_mode=last_known_mode)
-                print(f"\n[自动] 音乐已停止")
-                print(f"[自动] 恢复到 {last_known_mode} 模式")
-                last_known_mode = "MAIN"  # 重置
+            # 处理后台线程推送的环境变化事件（不阻塞、不做系统调用）
+            event = env_watcher.get_event()
+            while event is not None:
+                auto_mode.handle_event(*event)
+                event = env_watcher.get_event()
             
-            # 只有在非音乐模式时才检测浏览器（音乐模式优先级最高）
-            if not music_mode_override:
-                # 定期检测浏览器活动状态
-                if current_time - last_browser_check >= browser_check_interval:
-                    last_browser_check = current_time
-                    
-                    browser_active = is_browser_active()
-                    current_mode = gesture_recognizer.mode
-                    
-                    if browser_active and current_mode != "BROWSER":
-                        # 检测到浏览器且当前不在浏览器模式，自动切换
-                        last_known_mode = current_mode  # 保存当前模式
-                        gesture_recognizer.toggle_mode(target_mode="BROWSER")
-                        browser_name = get_browser_name()
-                        print(f"\n[自动] 检测到浏览器: {browser_name}")
-                        print("[自动] 切换到 浏览器模式")
-                        
-                    elif not browser_active and current_mode == "BROWSER":
-                        # 浏览器失去焦点且当前在浏览器模式，停止滚动并恢复之前模式
-                        action_executor._stop_browser_scroll()
-                        gesture_recognizer.toggle_mode(target_mode=last_known_mode)
-                        print(f"\n[自动] 浏览器失去焦点")
-                        print(f"[自动] 恢复到 {last_known_mode} 模式")
-                        last_known_mode = "MAIN"  # 重置
-            success, frame = cap.read()
-            if not success:
-                print("Failed to read frame from camera")
-                break
+            # 等待采集线程的新帧（事件唤醒，不再轮询休眠）
+            frame = grabber.read(timeout=0.1)
+            if frame is None:
+                if grabber.failed:
+                    log.error("Failed to read frame from camera")
+                    break
+                continue
             
-            frame = cv2.flip(frame, 1)
+            # 水平镜像由HandTracker完成（推理时换算坐标，显示时与复制合并）
             hand_landmarks_list, annotated_frame = hand_tracker.process_frame(frame)
             
             current_gesture = None
@@ -206,15 +398,20 @@ def main():
             
             if hand_landmarks_list:
                 landmarks = hand_landmarks_list[0]
-                finger_states = hand_tracker.get_finger_states(landmarks)
-                
-                # 记录手部位置用于轨迹追踪（调试用）
-                gesture_recognizer.record_hand_position(landmarks)
-                
-                # 识别动态手势（调试用，不用于控制）
-                dynamic_gesture = gesture_recognizer.recognize_dynamic_gesture(landmarks)
-                if dynamic_gesture and DEBUG_MODE:
-                    print(f"Dynamic gesture detected: {dynamic_gesture}")
+                if landmarks is last_landmarks:
+                    # 本帧跳过了推理，关键点与上一帧完全相同：复用手指状态，不重复记录轨迹
+                    finger_states = last_finger_states
+                else:
+                    last_landmarks = landmarks
+                    finger_states = last_finger_states = hand_tracker.get_finger_states(landmarks)
+                    
+                    # 记录手部位置用于轨迹追踪（调试用）
+                    gesture_recognizer.record_hand_position(landmarks)
+                    
+                    # 识别动态手势（调试用，不用于控制）
+                    dynamic_gesture = gesture_recognizer.recognize_dynamic_gesture(landmarks)
+                    if dynamic_gesture and log_debug:
+                        log.debug("Dynamic gesture detected: %s", dynamic_gesture)
                 
                 if finger_states:
                     current_gesture, is_new_gesture = gesture_recognizer.recognize_gesture(finger_states)
@@ -269,46 +466,51 @@ def main():
                 
                 # 清空手部运动轨迹
                 gesture_recognizer.clear_trajectory()
+                last_landmarks = None
             
             fps_counter.update()
             
-            # 更新悬浮窗状态（每0.5秒更新一次）
-            if current_time - getattr(main, 'last_status_update', 0) >= 0.5:
-                main.last_status_update = current_time
+            # 更新悬浮窗状态：模式/手势/音乐变化时立即推送，音量和亮度每0.5秒查询一次
+            status_key = (gesture_recognizer.mode, current_gesture, auto_mode.music_app_name)
+            refresh_levels = current_time - last_status_update >= 0.5
+            if refresh_levels or status_key != last_status_key:
+                last_status_key = status_key
                 
-                # 获取当前状态
-                status = action_executor.get_status()
+                if refresh_levels:
+                    last_status_update = current_time
+                    status = action_executor.get_status()
+                    status_levels = (status.get('current_volume', '-'), status.get('current_brightness', '-'))
                 
                 # 构建状态信息
                 status_info = {
-                    'mode': gesture_recognizer.mode,
+                    'mode': status_key[0],
                     'gesture': current_gesture if current_gesture else '-',
-                    'volume': status.get('current_volume', '-'),
-                    'brightness': status.get('current_brightness', '-'),
-                    'music_app': music_app_name if music_playing else None
+                    'volume': status_levels[0],
+                    'brightness': status_levels[1],
+                    'music_app': status_key[2]
                 }
                 
-                # 发送到悬浮窗（非阻塞）
-                try:
-                    status_queue.put_nowait(status_info)
-                except queue.Full:
-                    pass  # 如果队列满了，跳过这次更新
+                # 内容有变化才发送到悬浮窗（覆盖未取走的旧状态，不阻塞）
+                if status_info != last_status_info:
+                    last_status_info = status_info
+                    status_slot.put(status_info)
             
-            if not args.no_viz:
+            if show_frame and current_time >= next_show:
+                next_show += display_interval
+                if next_show <= current_time:
+                    # 落后超过一个间隔（启动或卡顿后）时重新对齐，不连续补帧
+                    next_show = current_time + display_interval
                 # 只显示原始的摄像头画面，不添加任何UI元素
-                cv2.imshow("Gesture Control System", annotated_frame)
+                show_frame(annotated_frame)
             
-            key = cv2.waitKey(1) & 0xFF
-            
-            if key == ord('q'):
-                print("用户请求退出")
-                break
-            elif key == ord('r'):
-                print("重置识别器...")
-                gesture_recognizer.reset()
-            elif key == ord('s'):
-                print("手动截图...")
-                action_executor.execute_action("screenshot")
+            key = read_key()
+            if key != 255:
+                if key == quit_key:
+                    log.info("用户请求退出")
+                    break
+                handler = key_actions.get(key)
+                if handler:
+                    handler()
     
     except KeyboardInterrupt:
         print("\nInterrupted by user (Ctrl+C)")
@@ -320,8 +522,21 @@ def main():
             traceback.print_exc()
     
     finally:
+        # 先输出队列中剩余的日志，之后的清理信息直接打印
+        if 'log_listener' in locals():
+            log_listener.stop()
+        
         print("\n清理资源...")
         
+        if 'grabber' in locals():
+            grabber.stop()
+        
+        if 'display' in locals() and display:
+            display.stop()
+        
+        if 'env_watcher' in locals():
+            env_watcher.stop()
+        
         if 'cap' in locals():
             cap.release()
             print("✓ 摄像头已释放")
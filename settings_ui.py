@@ -6,10 +6,12 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
 import os
+from dataclasses import asdict
 from typing import Dict, Any
 
+from config import DEFAULT_USER_SETTINGS, json_loads, json_dumps
+
 
 class SettingsWindow:
     """设置窗口类"""
@@ -21,21 +23,12 @@ class SettingsWindow:
         
     def _load_settings(self) -> Dict[str, Any]:
         """加载用户设置"""
-        default_settings = {
-            "camera_index": 0,
-            "camera_width": 1024,
-            "camera_height": 768,
-            "mouse_sensitivity": 8.0,
-            "volume_step": 0.05,
-            "brightness_step": 10,
-            "gesture_cooldown": 0.5,
-            "auto_mode_switch": True
-        }
+        default_settings = asdict(DEFAULT_USER_SETTINGS)
         
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    loaded = json_loads(f.read())
                     # 合并设置，保留用户自定义的，使用默认值补充缺失的
                     for key, value in default_settings.items():
                         if key not in loaded:
@@ -49,8 +42,8 @@ class SettingsWindow:
     def _save_settings(self) -> None:
         """保存用户设置"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            with open(self.config_file, 'wb') as f:
+                f.write(json_dumps(self.settings))
         except Exception as e:
             messagebox.showerror("错误", f"保存设置失败: {e}")
     
@@ -246,8 +239,8 @@ class SettingsWindow:
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.settings, f, indent=2, ensure_ascii=False)
+                with open(filename, 'wb') as f:
+                    f.write(json_dumps(self.settings))
                 messagebox.showinfo("成功", f"设置已导出到: {filename}")
             except Exception as e:
                 messagebox.showerror("错误", f"导出失败: {e}")
@@ -262,8 +255,8 @@ class SettingsWindow:
         
         if filename:
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    imported = json.load(f)
+                with open(filename, 'rb') as f:
+                    imported = json_loads(f.read())
                 
                 # 验证导入的设置
                 required_keys = ['camera_index', 'mouse_sensitivity', 'volume_step']